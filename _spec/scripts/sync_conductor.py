@@ -22,26 +22,42 @@ def sync_tracks():
     os.makedirs(dest_commands_dir, exist_ok=True)
 
     # 1. Synchronize core commands (non-recursive, just the .toml files in the root)
-    core_commands = [f for f in os.listdir(src_commands_dir) if f.endswith('.toml')]
+    with os.scandir(src_commands_dir) as it:
+        core_commands = [e.name for e in it if e.is_file() and e.name.endswith('.toml')]
     
     for cmd in core_commands:
         src_path = os.path.join(src_commands_dir, cmd)
         dest_path = os.path.join(dest_commands_dir, cmd)
+
+        # Copies keep the source mtime, so matching size + mtime means the file is already in sync
+        src_stat = os.stat(src_path)
+        try:
+            dest_stat = os.stat(dest_path)
+        except FileNotFoundError:
+            dest_stat = None
+        if (dest_stat is not None
+                and dest_stat.st_size == src_stat.st_size
+                and dest_stat.st_mtime_ns == src_stat.st_mtime_ns):
+            continue
+
         shutil.copy2(src_path, dest_path)
         print(f"Synced core command: {cmd}")
 
+    # Scan the destination once; DirEntry type info serves both cleanup passes without extra stats
+    with os.scandir(dest_commands_dir) as it:
+        dest_entries = list(it)
+
     # 2. Cleanup: Remove old subdirectories (resume/ and close/) if they exist in destination
-    for sub_dir in ['resume', 'close']:
-        target_path = os.path.join(dest_commands_dir, sub_dir)
-        if os.path.exists(target_path) and os.path.isdir(target_path):
-            shutil.rmtree(target_path)
-            print(f"Cleaned up legacy command directory: {sub_dir}")
+    for entry in dest_entries:
+        if entry.name in ('resume', 'close') and entry.is_dir():
+            shutil.rmtree(entry.path)
+            print(f"Cleaned up legacy command directory: {entry.name}")
 
     # 3. Cleanup stale core commands in destination that no longer exist in source
-    dest_core_commands = [f for f in os.listdir(dest_commands_dir) if f.endswith('.toml')]
-    for cmd in dest_core_commands:
-        if cmd not in core_commands and cmd != 'manual_input.toml':
-            os.remove(os.path.join(dest_commands_dir, cmd))
+    for entry in dest_entries:
+        cmd = entry.name
+        if cmd.endswith('.toml') and cmd not in core_commands and cmd != 'manual_input.toml':
+            os.remove(entry.path)
             print(f"Removed stale core command: {cmd}")
 
     print("_spec commands have been synchronized and cleaned.")
@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import sync_conductor
+
+
+def _make_workspace(root):
+    src_dir = root / '_spec' / 'commands' / '_spec'
+    dest_dir = root / '.gemini' / 'commands' / '_spec'
+    src_dir.mkdir(parents=True)
+    (src_dir / 'a.toml').write_text('a = 1\n')
+    (src_dir / 'b.toml').write_text('b = 2\n')
+    return src_dir, dest_dir
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setenv('WORKSPACE_ROOT', str(tmp_path))
+    return _make_workspace(tmp_path)
+
+
+def test_sync_copies_contents_and_metadata(workspace):
+    src_dir, dest_dir = workspace
+
+    sync_conductor.sync_tracks()
+
+    for name in ('a.toml', 'b.toml'):
+        src_stat = os.stat(src_dir / name)
+        dest_stat = os.stat(dest_dir / name)
+        assert (dest_dir / name).read_text() == (src_dir / name).read_text()
+        assert dest_stat.st_mtime_ns == src_stat.st_mtime_ns
+        assert dest_stat.st_mode & 0o777 == src_stat.st_mode & 0o777
+
+
+def test_second_sync_copies_nothing(workspace, monkeypatch, capsys):
+    src_dir, dest_dir = workspace
+    sync_conductor.sync_tracks()
+    capsys.readouterr()
+
+    copied = []
+    real_copy = sync_conductor.shutil.copy2
+
+    def recording_copy(src, dest):
+        copied.append(src)
+        return real_copy(src, dest)
+
+    monkeypatch.setattr(sync_conductor.shutil, 'copy2', recording_copy)
+
+    sync_conductor.sync_tracks()
+    assert copied == []
+    assert 'Synced core command' not in capsys.readouterr().out
+
+    (src_dir / 'b.toml').write_text('b = 20\n')
+    sync_conductor.sync_tracks()
+    assert copied == [str(src_dir / 'b.toml')]
+    assert (dest_dir / 'b.toml').read_text() == 'b = 20\n'
@@ -6,6 +6,7 @@ Uses pyprompt to show an interactive menu for selecting which sketch to compile.
 Outputs the selected sketch name (without .ino extension) to stdout for use by Makefile.
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -16,7 +17,6 @@ from outerm import (
     warning as _warning_import,
     info as _info_import,
 )
-from pyprompt import select as _select_import
 
 # Type narrowing: ensure functions are available
 from typing import Callable, cast, Any
@@ -29,22 +29,15 @@ if _warning_import is None:
     raise ImportError("warning must be available")
 if _info_import is None:
     raise ImportError("info must be available")
-if _select_import is None:
-    raise ImportError("select must be available")
 
 # Create local aliases with type casting for type narrowing
 write_header: Callable[..., Any] = cast(Callable[..., Any], _write_header_import)
 error: Callable[..., Any] = cast(Callable[..., Any], _error_import)
 warning: Callable[..., Any] = cast(Callable[..., Any], _warning_import)
 info: Callable[..., Any] = cast(Callable[..., Any], _info_import)
-select: Callable[..., Any] = cast(Callable[..., Any], _select_import)
 
-# Check if prompt_toolkit is available (pyprompt requires it)
-try:
-    import prompt_toolkit  
-    HAS_PROMPT_TOOLKIT = True
-except ImportError:
-    HAS_PROMPT_TOOLKIT = False
+# Check if prompt_toolkit is available (pyprompt requires it) without importing it
+HAS_PROMPT_TOOLKIT = importlib.util.find_spec("prompt_toolkit") is not None
 
 # Sketch definitions
 SKETCHES = [
@@ -84,6 +77,12 @@ def select_sketch_interactive() -> str:
         warning("prompt_toolkit not available, falling back to default sketch")
         return available_sketches[0]["name"]
     
+    # Imported only once prompt_toolkit is known to be present; pyprompt loads it eagerly
+    from pyprompt import select as _select_import
+    if _select_import is None:
+        raise ImportError("select must be available")
+    select: Callable[..., Any] = cast(Callable[..., Any], _select_import)
+    
     # Show header
     write_header("ESP32-S3 BME680 - Sketch Selection")
     print()
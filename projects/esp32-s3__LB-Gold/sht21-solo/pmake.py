@@ -12,28 +12,34 @@ BAUDRATE = 115200
 CREATE_LOG = False
 
 
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
-# Import py_makefile package
-try:
+
+def main() -> int:
+    """Create config and run py-makefile orchestrator."""
+    # Probe without importing so the error path stays cheap; import for real only when present
+    if importlib.util.find_spec("py_makefile") is None:
+        print("Error: py-makefile not found. Install with: pip install -e lib/py_makefile")
+        return 1
+
     from py_makefile import PmakeConfig, run
     from py_makefile.exceptions import PmakeConfigError
-except ImportError as e:
-    print(f"Error: py-makefile not found. Install with: pip install -e lib/py_makefile")
-    print(f"Import error: {e}")
-    sys.exit(1)
 
+    # abspath is a string op; only pay for resolve() when arduino-cli isn't found (symlinked checkout)
+    script_path = Path(os.path.abspath(__file__))
+    arduino_cli_path = script_path.parents[3] / "Arduino" / "arduino-cli.exe"
+    if not arduino_cli_path.exists():
+        script_path = script_path.resolve()
+        arduino_cli_path = script_path.parents[3] / "Arduino" / "arduino-cli.exe"
 
-def main() -> int:
-    """Create config and run py-makefile orchestrator."""
-    script_path = Path(__file__).resolve()
-    
     try:
         # Use from_script_path for automatic project root detection
         config = PmakeConfig.from_script_path(
             script_path=script_path,
-            arduino_cli_path=script_path.parent.parent.parent.parent / "Arduino" / "arduino-cli.exe",
+            arduino_cli_path=arduino_cli_path,
             fqbn=FQBN,
             sketch_name=SKETCH_NAME,
             port=PORT,
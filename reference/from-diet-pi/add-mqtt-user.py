@@ -13,6 +13,7 @@ import os
 import subprocess
 import platform
 import argparse
+import importlib.util
 from pathlib import Path
 from typing import Optional
 
@@ -46,12 +47,10 @@ HAS_PYPROMPT = False
 PYPROMPT_AVAILABLE = False
 
 def check_pyprompt_available() -> bool:
-    """Check if pyprompt is available."""
-    try:
-        import pyprompt
-        return True
-    except ImportError:
-        return False
+    """Check if pyprompt is available without importing it."""
+    # Clear finder caches so a package installed moments ago is visible
+    importlib.invalidate_caches()
+    return importlib.util.find_spec("pyprompt") is not None
 
 def check_command(cmd: str) -> bool:
     """Check if a command exists in PATH."""